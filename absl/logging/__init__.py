@@ -325,6 +325,10 @@ VERBOSITY = flags.DEFINE_flag(
         allow_hide_cpp=True,
     )
 )
+# The -v/--verbosity Flag object, bound once so the level_* predicates don't
+# go through FlagValues.__getitem__ on every call. The value itself is read
+# live from the flag because flagsaver restores Flag.__dict__ directly.
+_verbosity_flag = FLAGS['verbosity']
 LOGGER_LEVELS = flags.DEFINE_flag(
     _LoggerLevelsFlag(
         'logger_levels',
@@ -367,7 +371,7 @@ SHOWPREFIXFORINFO = flags.DEFINE_boolean(
 
 def get_verbosity():
   """Returns the logging verbosity."""
-  return FLAGS['verbosity'].value
+  return _verbosity_flag.value
 
 
 def set_verbosity(v):
@@ -673,17 +677,17 @@ def flush():
 
 def level_debug():
   """Returns True if debug logging is turned on."""
-  return get_verbosity() >= DEBUG
+  return _verbosity_flag.value >= DEBUG
 
 
 def level_info():
   """Returns True if info logging is turned on."""
-  return get_verbosity() >= INFO
+  return _verbosity_flag.value >= INFO
 
 
 def level_warning():
   """Returns True if warning logging is turned on."""
-  return get_verbosity() >= WARNING
+  return _verbosity_flag.value >= WARNING
 
 
 level_warn = level_warning  # Deprecated function.
@@ -691,7 +695,7 @@ level_warn = level_warning  # Deprecated function.
 
 def level_error():
   """Returns True if error logging is turned on."""
-  return get_verbosity() >= ERROR
+  return _verbosity_flag.value >= ERROR
 
 
 def get_log_file_name(level=INFO):
@@ -927,6 +927,15 @@ class LoggingTest(absltest.TestCase):
 
     logging.set_verbosity(old_level)
 
+  def test_logging_levels_follow_flagsaver_restore(self):
+    with flagsaver.flagsaver():
+      logging.set_verbosity(logging.WARNING)
+      with flagsaver.flagsaver(verbosity=logging.DEBUG):
+        self.assertTrue(logging.level_debug())
+      self.assertFalse(logging.level_debug())
+      self.assertFalse(logging.level_info())
+      self.assertTrue(logging.level_warning())
+
   def test_set_verbosity_strings(self):
     old_level = logging.get_verbosity()
 
@@ -969,6 +978,9 @@ class LoggingTest(absltest.TestCase):
     self.assertEqual(logging.get_verbosity(), logging.ERROR)
     logging.set_verbosity(str(logging.FATAL))
     self.assertEqual(logging.get_verbosity(), logging.FATAL)
+    # vlog levels are not absl level constants but are accepted as well.
+    logging.set_verbosity('2')
+    self.assertEqual(logging.get_verbosity(), 2)
 
     logging.set_verbosity(old_level)
 
@@ -987,10 +999,21 @@ class LoggingTest(absltest.TestCase):
         logging.get_absl_handler(), logging.ABSLHandler)
 
 
-@mock.patch.object(logging.ABSLLogger, 'register_frame_to_skip')
 class LogSkipPrefixTest(absltest.TestCase):
   """Tests for logging.skip_log_prefix."""
 
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    # Patch once for the whole class; setUp resets the mock between tests.
+    patcher = mock.patch.object(logging.ABSLLogger, 'register_frame_to_skip')
+    cls.mock_skip_register = patcher.start()
+    cls.addClassCleanup(patcher.stop)
+
+  def setUp(self):
+    super().setUp()
+    self.mock_skip_register.reset_mock()
+
   def _log_some_info(self):
     """Logging helper function for LogSkipPrefixTest."""
     logging.info('info')
@@ -1001,50 +1024,52 @@ class LogSkipPrefixTest(absltest.TestCase):
       logging.info('info nested')
     return _log_nested_inner
 
-  def test_skip_log_prefix_with_name(self, mock_skip_register):
+  def test_skip_log_prefix_with_name(self):
     retval = logging.skip_log_prefix('_log_some_info')
-    mock_skip_register.assert_called_once_with(__file__, '_log_some_info', None)
+    self.mock_skip_register.assert_called_once_with(
+        __file__, '_log_some_info', None)
     self.assertEqual(retval, '_log_some_info')
 
-  def test_skip_log_prefix_with_func(self, mock_skip_register):
+  def test_skip_log_prefix_with_func(self):
     retval = logging.skip_log_prefix(self._log_some_info)
-    mock_skip_register.assert_called_once_with(
+    self.mock_skip_register.assert_called_once_with(
         __file__, '_log_some_info', mock.ANY)
     self.assertEqual(retval, self._log_some_info)
 
-  def test_skip_log_prefix_with_functools_partial(self, mock_skip_register):
+  def test_skip_log_prefix_with_functools_partial(self):
     partial_input = functools.partial(self._log_some_info)
     with self.assertRaises(ValueError):
       _ = logging.skip_log_prefix(partial_input)
-    mock_skip_register.assert_not_called()
+    self.mock_skip_register.assert_not_called()
 
-  def test_skip_log_prefix_with_lambda(self, mock_skip_register):
+  def test_skip_log_prefix_with_lambda(self):
     lambda_input = lambda _: self._log_some_info()
     retval = logging.skip_log_prefix(lambda_input)
-    mock_skip_register.assert_called_once_with(__file__, '<lambda>', mock.ANY)
+    self.mock_skip_register.assert_called_once_with(
+        __file__, '<lambda>', mock.ANY)
     self.assertEqual(retval, lambda_input)
 
-  def test_skip_log_prefix_with_bad_input(self, mock_skip_register):
+  def test_skip_log_prefix_with_bad_input(self):
     dict_input = {1: 2, 2: 3}
     with self.assertRaises(TypeError):
       _ = logging.skip_log_prefix(dict_input)
-    mock_skip_register.assert_not_called()
+    self.mock_skip_register.assert_not_called()
 
-  def test_skip_log_prefix_with_nested_func(self, mock_skip_register):
+  def test_skip_log_prefix_with_nested_func(self):
     nested_input = self._log_nested_outer()
     retval = logging.skip_log_prefix(nested_input)
-    mock_skip_register.assert_called_once_with(
+    self.mock_skip_register.assert_called_once_with(
         __file__, '_log_nested_inner', mock.ANY)
     self.assertEqual(retval, nested_input)
 
-  def test_skip_log_prefix_decorator(self, mock_skip_register):
+  def test_skip_log_prefix_decorator(self):
 
     @logging.skip_log_prefix
     def _log_decorated():
       logging.info('decorated')
 
     del _log_decorated
-    mock_skip_register.assert_called_once_with(
+    self.mock_skip_register.assert_called_once_with(
         __file__, '_log_decorated', mock.ANY)
 
 
@@ -1489,20 +1489,15 @@ class TestCase(unittest.TestCase):
       subsequence: the list we hope will be a subsequence of container.
       msg: Optional message to report on failure.
     """
-    first_nonmatching = None
-    reversed_container = list(reversed(container))
     subsequence = list(subsequence)
+    # A single pass over container: each search resumes after the previous
+    # match, so a missing element is detected without rescanning.
+    remaining = iter(container)
 
     for e in subsequence:
-      if e not in reversed_container:
-        first_nonmatching = e
-        break
-      while e != reversed_container.pop():
-        pass
-
-    if first_nonmatching is not None:
-      self.fail('%s not a subsequence of %s. First non-matching element: %s' %
-                (subsequence, container, first_nonmatching), msg)
+      if not any(x is e or x == e for x in remaining):
+        self.fail('%s not a subsequence of %s. First non-matching element: %s' %
+                  (subsequence, container, e), msg)
 
   def assertContainsExactSubsequence(self, container, subsequence, msg=None):
     """Asserts that "container" contains "subsequence" as an exact subsequence.
@@ -1987,7 +1982,7 @@ def _walk_structure_for_problems(
     a, b, aname, bname, problem_list, leaf_assert_equal_func, failure_exception
 ):
   """The recursive comparison behind assertSameStructure."""
-  if type(a) != type(b) and not (  # pylint: disable=unidiomatic-typecheck
+  if type(a) is not type(b) and not (  # pylint: disable=unidiomatic-typecheck
       _are_both_of_integer_type(a, b) or _are_both_of_sequence_type(a, b) or
       _are_both_of_set_type(a, b) or _are_both_of_mapping_type(a, b)):
     # We do not distinguish between int and long types as 99.99% of Python 2
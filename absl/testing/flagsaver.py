@@ -236,7 +236,16 @@ def save_flag_values(
     Dictionary mapping keys to values. Keys are flag names, values are
     corresponding ``__dict__`` members. E.g. ``{'key': value_dict, ...}``.
   """
-  return {name: _copy_flag_dict(flag_values[name]) for name in flag_values}
+  # A flag with a short name is listed under both names; copy it only once.
+  copies = {}
+  saved_flag_values = {}
+  for name in flag_values:
+    flag = flag_values[name]
+    flag_copy = copies.get(flag)
+    if flag_copy is None:
+      flag_copy = copies[flag] = _copy_flag_dict(flag)
+    saved_flag_values[name] = flag_copy
+  return saved_flag_values
 
 
 def restore_flag_values(
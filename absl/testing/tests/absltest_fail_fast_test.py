@@ -33,9 +33,11 @@ class TestFailFastTest(parameterized.TestCase):
   This is done by setting the fail fast environment variable
   """
 
-  def setUp(self):
-    super().setUp()
-    self._test_name = 'absl/testing/tests/absltest_fail_fast_test_helper'
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    cls._helper_path = _bazelize_command.get_executable_path(
+        'absl/testing/tests/absltest_fail_fast_test_helper')
 
   def _run_fail_fast(self, fail_fast, use_app_run):
     """Runs the py_test binary in a subprocess.
@@ -53,16 +55,16 @@ class TestFailFastTest(parameterized.TestCase):
       env['TESTBRIDGE_TEST_RUNNER_FAIL_FAST'] = fail_fast
     env['USE_APP_RUN'] = '1' if use_app_run else '0'
 
-    proc = subprocess.Popen(
-        args=[_bazelize_command.get_executable_path(self._test_name)],
+    result = subprocess.run(
+        args=[self._helper_path],
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        universal_newlines=True)
-    stdout = proc.communicate()[0]
+        universal_newlines=True,
+        check=False)
 
-    logging.info('output: %s', stdout)
-    return stdout, proc.wait()
+    logging.info('output: %s', result.stdout)
+    return result.stdout, result.returncode
 
   def test_no_fail_fast(self, use_app_run):
     out, exit_code = self._run_fail_fast(None, use_app_run)
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for test filtering protocol."""
 
+from concurrent import futures
 import subprocess
 import sys
 
@@ -36,9 +37,15 @@ class TestFilteringTest(absltest.TestCase):
   the filters as command line arguments.
   """
 
-  def setUp(self):
-    super().setUp()
-    self._test_name = 'absl/testing/tests/absltest_filtering_test_helper'
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    cls._helper_path = _bazelize_command.get_executable_path(
+        'absl/testing/tests/absltest_filtering_test_helper')
+    # Used by tests that need more than one helper run. The runs only wait on
+    # child processes, so threads are enough to overlap them.
+    cls._executor = futures.ThreadPoolExecutor()
+    cls.addClassCleanup(cls._executor.shutdown)
 
   def _run_filtered(self, test_filter, use_env_variable, use_app_run):
     """Runs the py_test binary in a subprocess.
@@ -64,17 +71,16 @@ class TestFilteringTest(absltest.TestCase):
         additional_args.append('--')
         additional_args.extend(['-k=' + f for f in test_filter.split(' ')])
 
-    proc = subprocess.Popen(
-        args=([_bazelize_command.get_executable_path(self._test_name)] +
-              additional_args),
+    result = subprocess.run(
+        args=[self._helper_path] + additional_args,
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        universal_newlines=True)
-    stdout = proc.communicate()[0]
+        universal_newlines=True,
+        check=False)
 
-    logging.info('output: %s', stdout)
-    return stdout, proc.wait()
+    logging.info('output: %s', result.stdout)
+    return result.stdout, result.returncode
 
   def test_no_filter(self, use_env_variable, use_app_run):
     out, exit_code = self._run_filtered(None, use_env_variable, use_app_run)
@@ -92,14 +98,17 @@ class TestFilteringTest(absltest.TestCase):
     self.assertNotIn('class B', out)
 
   def test_method_filter(self, use_env_variable, use_app_run):
-    out, exit_code = self._run_filtered('ClassB.testA', use_env_variable,
-                                        use_app_run)
+    test_a_run = self._executor.submit(self._run_filtered, 'ClassB.testA',
+                                       use_env_variable, use_app_run)
+    test_e_run = self._executor.submit(self._run_filtered, 'ClassB.testE',
+                                       use_env_variable, use_app_run)
+
+    out, exit_code = test_a_run.result()
     self.assertEqual(0, exit_code)
     self.assertNotIn('class A', out)
     self.assertNotIn('class B test B', out)
 
-    out, exit_code = self._run_filtered('ClassB.testE', use_env_variable,
-                                        use_app_run)
+    out, exit_code = test_e_run.result()
     self.assertEqual(1, exit_code)
     self.assertNotIn('class A', out)
 
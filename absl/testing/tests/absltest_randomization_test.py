@@ -65,7 +65,7 @@ class TestOrderRandomizationTest(parameterized.TestCase):
     stdout, _ = proc.communicate()
 
     test_lines = [l for l in stdout.splitlines() if l.startswith('class ')]
-    return stdout, test_lines, proc.wait()
+    return stdout, test_lines, proc.returncode
 
   def test_no_args(self):
     output, tests, exit_code = self._run_test([], None)
@@ -14,6 +14,7 @@
 
 """Tests for test sharding protocol."""
 
+from concurrent import futures
 import os
 import subprocess
 import sys
@@ -27,20 +28,40 @@ from absl.testing.tests import absltest_env
 NUM_TEST_METHODS = 8  # Hard-coded, based on absltest_sharding_test_helper.py
 
 
+def _remove_if_exists(path):
+  try:
+    os.unlink(path)
+  except FileNotFoundError:
+    pass
+
+
 class TestShardingTest(parameterized.TestCase):
   """Integration tests: Runs a test binary with sharding.
 
   This is done by setting the sharding environment variables.
   """
 
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    cls._helper_paths = {
+        helper_name: _bazelize_command.get_executable_path(
+            'absl/testing/tests/' + helper_name)
+        for helper_name in ('absltest_sharding_test_helper',
+                            'absltest_sharding_test_helper_no_tests')
+    }
+    # Shared by all tests that run several helper processes concurrently.
+    cls._executor = futures.ThreadPoolExecutor()
+    cls.addClassCleanup(cls._executor.shutdown)
+
   def setUp(self):
     super().setUp()
     self._shard_file = None
 
   def tearDown(self):
     super().tearDown()
-    if self._shard_file is not None and os.path.exists(self._shard_file):
-      os.unlink(self._shard_file)
+    if self._shard_file is not None:
+      _remove_if_exists(self._shard_file)
 
   def _run_sharded(
       self,
@@ -62,35 +83,41 @@ class TestShardingTest(parameterized.TestCase):
       helper_name: The name of the helper binary.
 
     Returns:
-      (stdout, exit_code) tuple of (string, int).
+      (stdout, method_list, exit_code) tuple of (string, list of strings, int).
+      method_list holds the "class ..." lines printed by the helper's test
+      methods, in the order they ran.
     """
-    env = absltest_env.inherited_env()
-    if additional_env:
-      env.update(additional_env)
-    env.update({
+    env = {
+        **absltest_env.inherited_env(),
+        **(additional_env or {}),
         'TEST_TOTAL_SHARDS': str(total_shards),
-        'TEST_SHARD_INDEX': str(shard_index)
-    })
+        'TEST_SHARD_INDEX': str(shard_index),
+    }
     if shard_file:
       self._shard_file = shard_file
       env['TEST_SHARD_STATUS_FILE'] = shard_file
-      if os.path.exists(shard_file):
-        os.unlink(shard_file)
+      _remove_if_exists(shard_file)
 
-    helper = 'absl/testing/tests/' + helper_name
-    proc = subprocess.Popen(
-        args=[_bazelize_command.get_executable_path(helper)],
+    lines = []
+    method_list = []
+    with subprocess.Popen(
+        args=[self._helper_paths[helper_name]],
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         universal_newlines=True,
-    )
-    stdout = proc.communicate()[0]
+    ) as proc:
+      # Pick out the test method lines while reading, rather than scanning the
+      # whole output again afterwards.
+      for line in proc.stdout:
+        lines.append(line)
+        if line.startswith('class'):
+          method_list.append(line.rstrip('\n'))
 
     if shard_file:
       self.assertTrue(os.path.exists(shard_file))
 
-    return (stdout, proc.wait())
+    return (''.join(lines), method_list, proc.returncode)
 
   def _assert_sharding_correctness(self, total_shards):
     """Assert the primary correctness and performance of sharding.
@@ -107,15 +134,20 @@ class TestShardingTest(parameterized.TestCase):
     combined_outerr = []  # A list of strings
     exit_code_by_shard = []  # A list of ints
 
-    for i in range(total_shards):
-      (out, exit_code) = self._run_sharded(total_shards, i)
-      method_list = [x for x in out.split('\n') if x.startswith('class')]
+    # The shards are independent processes, so run them concurrently.
+    results = [
+        self._executor.submit(self._run_sharded, total_shards, i)
+        for i in range(total_shards)
+    ]
+    for result in results:
+      (_, method_list, exit_code) = result.result()
       outerr_by_shard.append(method_list)
       combined_outerr.extend(method_list)
       exit_code_by_shard.append(exit_code)
 
-    self.assertLen([x for x in exit_code_by_shard if x != 0], 1,
-                   'Expected exactly one failure')
+    self.assertEqual(
+        exit_code_by_shard.count(0), total_shards - 1,
+        f'Expected exactly one failure, exit codes: {exit_code_by_shard}')
 
     # Test completeness and partition properties.
     self.assertLen(combined_outerr, NUM_TEST_METHODS,
@@ -123,47 +155,53 @@ class TestShardingTest(parameterized.TestCase):
     self.assertLen(set(combined_outerr), NUM_TEST_METHODS,
                    'Completeness requirement not met')
 
-    # Test balance:
-    for i in range(len(outerr_by_shard)):
-      self.assertGreaterEqual(len(outerr_by_shard[i]),
-                              (NUM_TEST_METHODS / total_shards) - 1,
+    # Test balance: each shard runs at least ceil(methods / shards) - 1
+    # methods.
+    min_methods_per_shard = -(-NUM_TEST_METHODS // total_shards) - 1
+    for i, method_list in enumerate(outerr_by_shard):
+      self.assertGreaterEqual(len(method_list), min_methods_per_shard,
                               'Shard %d of %d out of balance' %
-                              (i, len(outerr_by_shard)))
+                              (i, total_shards))
 
   def test_shard_file(self):
     self._run_sharded(3, 1, os.path.join(
         absltest.TEST_TMPDIR.value, 'shard_file'))
 
   def test_zero_shards(self):
-    out, exit_code = self._run_sharded(0, 0)
+    out, _, exit_code = self._run_sharded(0, 0)
     self.assertEqual(1, exit_code)
     self.assertGreaterEqual(out.find('Bad sharding values. index=0, total=0'),
                             0, 'Bad output: %s' % (out))
 
-  def test_with_four_shards(self):
-    self._assert_sharding_correctness(4)
-
-  def test_with_one_shard(self):
-    self._assert_sharding_correctness(1)
-
-  def test_with_ten_shards(self):
-    shards = 10
-    # This test relies on the shard count to be greater than the number of
-    # tests, to ensure that the non-zero shards won't fail even if no tests ran
-    # on Python 3.12+.
-    self.assertGreater(shards, NUM_TEST_METHODS)
-    self._assert_sharding_correctness(shards)
+  @parameterized.named_parameters(
+      ('one_shard', 1),
+      ('four_shards', 4),
+      # The shard count must be greater than the number of tests, to ensure
+      # that the non-zero shards won't fail even if no tests ran on Python
+      # 3.12+.
+      ('more_shards_than_tests', NUM_TEST_METHODS + 2),
+  )
+  def test_with_shards(self, total_shards):
+    self._assert_sharding_correctness(total_shards)
 
   def test_sharding_with_randomization(self):
     # If we're both sharding *and* randomizing, we need to confirm that we
     # randomize within the shard; we use two seeds to confirm we're seeing the
     # same tests (sharding is consistent) in a different order.
+    results = [
+        self._executor.submit(
+            self._run_sharded,
+            2,
+            0,
+            additional_env={'TEST_RANDOMIZE_ORDERING_SEED': seed},
+        )
+        for seed in ('7', '17')
+    ]
     tests_seen = []
-    for seed in ('7', '17'):
-      out, exit_code = self._run_sharded(
-          2, 0, additional_env={'TEST_RANDOMIZE_ORDERING_SEED': seed})
+    for result in results:
+      _, method_list, exit_code = result.result()
       self.assertEqual(0, exit_code)
-      tests_seen.append([x for x in out.splitlines() if x.startswith('class')])
+      tests_seen.append(method_list)
     first_tests, second_tests = tests_seen  # pylint: disable=unbalanced-tuple-unpacking
     self.assertEqual(set(first_tests), set(second_tests))
     self.assertNotEqual(first_tests, second_tests)
@@ -183,7 +221,7 @@ class TestShardingTest(parameterized.TestCase):
       expected_exit_code = 5
     else:
       expected_exit_code = 0
-    out, exit_code = self._run_sharded(
+    out, _, exit_code = self._run_sharded(
         total_shards,
         shard_index,
         helper_name='absltest_sharding_test_helper_no_tests',
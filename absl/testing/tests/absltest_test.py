@@ -16,11 +16,14 @@
 
 import collections
 from collections.abc import Mapping
+from concurrent import futures
 import contextlib
 import dataclasses
+import functools
 import os
 import pathlib
 import re
+import shutil
 import stat
 import string
 import subprocess
@@ -51,60 +54,188 @@ class TestMapping(Mapping):
     return iter(self._dict)
 
 
-class BaseTestCase(parameterized.TestCase):
+class _NamedObj:
+  """An object whose repr is its name, but is compared by identity."""
 
-  def _get_helper_exec_path(self, helper_name):
-    helper = 'absl/testing/tests/' + helper_name
-    return _bazelize_command.get_executable_path(helper)
+  def __init__(self, name):
+    self.name = name
 
-  def run_helper(
-      self,
-      test_id,
-      args,
-      env_overrides,
-      expect_success,
-      helper_name=None,
+  def __repr__(self):
+    return self.name
+
+
+class _RaisesOnRepr:
+
+  def __repr__(self):
+    return 1/0  # Intentionally broken __repr__ implementation.
+
+
+class _RaisesOnLt:
+
+  def __lt__(self, unused_other):
+    raise TypeError('Object is unordered.')
+
+  def __repr__(self):
+    return '<RaisesOnLt object>'
+
+
+@functools.total_ordering
+class _OrderedOnX:
+  """Compares only on x, as in the assertTotallyOrdered docstring."""
+
+  __slots__ = ('x', 'y')
+
+  def __init__(self, x, y):
+    self.x = x
+    self.y = y
+
+  def __hash__(self):
+    return hash(self.x)
+
+  def __repr__(self):
+    return '%s(%r, %r)' % (type(self).__name__, self.x, self.y)
+
+  def __eq__(self, other):
+    try:
+      return self.x == other.x
+    except AttributeError:
+      return NotImplemented
+
+  def __lt__(self, other):
+    try:
+      return self.x < other.x
+    except AttributeError:
+      return NotImplemented
+
+
+class _UnhashableOrderedOnX(_OrderedOnX):
+  """Like _OrderedOnX, but not hashable."""
+
+  __slots__ = ()
+  __hash__ = None
+
+
+# Runs helper binaries for BaseTestCase.submit_helper. The runs only wait on
+# child processes, so threads are enough to overlap them.
+_HELPER_EXECUTOR = futures.ThreadPoolExecutor()
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_helper_path(helper_name):
+  """Returns the executable path of a helper binary; stable per process."""
+  helper = 'absl/testing/tests/' + helper_name
+  return _bazelize_command.get_executable_path(helper)
+
+
+def _run_helper_command(command, env):
+  """Runs a helper binary command and returns (stdout, stderr, exit_code)."""
+  process = subprocess.Popen(
+      command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env,
+      encoding='utf-8', errors='replace')
+  stdout, stderr = process.communicate()
+  return stdout, stderr, process.returncode
+
+
+class BaseTestCase(parameterized.TestCase):
+
+  @classmethod
+  def _get_helper_command_and_env(
+      cls, test_id, args, env_overrides, helper_name
   ):
     env = absltest_env.inherited_env()
     for key, value in env_overrides.items():
       if value is None:
-        if key in env:
-          del env[key]
+        env.pop(key, None)
       else:
         env[key] = value
 
     if helper_name is None:
       helper_name = 'absltest_test_helper'
-    command = [self._get_helper_exec_path(helper_name)]
+    command = [_resolve_helper_path(helper_name)]
     if test_id is not None:
       command.append(f'--test_id={test_id}')
     command.extend(args)
-    process = subprocess.Popen(
-        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env,
-        universal_newlines=True)
-    stdout, stderr = process.communicate()
+    return command, env
+
+  def assert_helper_result(self, result, expect_success):
+    """Asserts the exit code of a helper run and returns the result unchanged.
+
+    Args:
+      result: (stdout, stderr, exit_code) tuple of a helper run.
+      expect_success: bool, whether the helper is expected to exit with 0.
+
+    Returns:
+      The `result` argument.
+    """
+    stdout, stderr, exit_code = result
     if expect_success:
       self.assertEqual(
           0,
-          process.returncode,
+          exit_code,
           'Expected success, but failed with exit code {},'
-          ' stdout:\n{}\nstderr:\n{}\n'.format(
-              process.returncode, stdout, stderr
-          ),
+          ' stdout:\n{}\nstderr:\n{}\n'.format(exit_code, stdout, stderr),
       )
     else:
       self.assertGreater(
-          process.returncode,
+          exit_code,
           0,
           'Expected failure, but succeeded with '
           'stdout:\n{}\nstderr:\n{}\n'.format(stdout, stderr),
       )
-    return stdout, stderr, process.returncode
+    return result
+
+  @classmethod
+  def submit_helper(cls, test_id, args, env_overrides, helper_name=None):
+    """Starts a helper run in the background.
+
+    Use this over run_helper when there are several independent helper runs,
+    so they overlap instead of running one after another. Pass the future's
+    result to assert_helper_result to check the exit code.
+
+    Args:
+      test_id: int or None, the --test_id value to pass to the helper.
+      args: list of extra command line arguments.
+      env_overrides: dict of environment variables to set, or to unset if the
+        value is None.
+      helper_name: str, the helper binary name; defaults to
+        'absltest_test_helper'.
+
+    Returns:
+      A concurrent.futures.Future of a (stdout, stderr, exit_code) tuple.
+    """
+    command, env = cls._get_helper_command_and_env(
+        test_id, args, env_overrides, helper_name
+    )
+    return _HELPER_EXECUTOR.submit(_run_helper_command, command, env)
+
+  def run_helper(
+      self,
+      test_id,
+      args,
+      env_overrides,
+      expect_success,
+      helper_name=None,
+  ):
+    command, env = self._get_helper_command_and_env(
+        test_id, args, env_overrides, helper_name
+    )
+    return self.assert_helper_result(
+        _run_helper_command(command, env), expect_success
+    )
 
 
 class TestCaseTest(BaseTestCase):
   longMessage = True
 
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    # A TEST_XMLOUTPUTDIR/XML_OUTPUT_FILE location the test_xml_output_file_*
+    # tests expect the helper to ignore. Nothing is written there when the
+    # helper behaves, so the tests share one directory.
+    cls._decoy_xml_dir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
+    cls.addClassCleanup(shutil.rmtree, cls._decoy_xml_dir, ignore_errors=True)
+
   def run_helper(
       self, test_id, args, env_overrides, expect_success, helper_name=None
   ):
@@ -116,6 +247,13 @@ class TestCaseTest(BaseTestCase):
         helper_name,
     )
 
+  def _assert_all_raise(self, exception, cases):
+    """Asserts that calling each (func, args) pair in `cases` raises."""
+    for func, args in cases:
+      with self.subTest(func=func.__name__, args=args):
+        with self.assertRaises(exception):
+          func(*args)
+
   def test_flags_no_env_var_no_flags(self):
     self.run_helper(
         1,
@@ -127,8 +265,8 @@ class TestCaseTest(BaseTestCase):
         expect_success=True)
 
   def test_flags_env_var_no_flags(self):
-    tmpdir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
-    srcdir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
+    tmpdir = self.create_tempdir('tmpdir').full_path
+    srcdir = self.create_tempdir('srcdir').full_path
     self.run_helper(
         2,
         [],
@@ -141,8 +279,8 @@ class TestCaseTest(BaseTestCase):
         expect_success=True)
 
   def test_flags_no_env_var_flags(self):
-    tmpdir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
-    srcdir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
+    tmpdir = self.create_tempdir('tmpdir').full_path
+    srcdir = self.create_tempdir('srcdir').full_path
     self.run_helper(
         3,
         [
@@ -161,10 +299,10 @@ class TestCaseTest(BaseTestCase):
     )
 
   def test_flags_env_var_flags(self):
-    tmpdir_from_flag = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
-    srcdir_from_flag = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
-    tmpdir_from_env_var = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
-    srcdir_from_env_var = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
+    tmpdir_from_flag = self.create_tempdir('tmpdir_from_flag').full_path
+    srcdir_from_flag = self.create_tempdir('srcdir_from_flag').full_path
+    tmpdir_from_env_var = self.create_tempdir('tmpdir_from_env_var').full_path
+    srcdir_from_env_var = self.create_tempdir('srcdir_from_env_var').full_path
     self.run_helper(
         4,
         [
@@ -183,9 +321,9 @@ class TestCaseTest(BaseTestCase):
     )
 
   def test_xml_output_file_from_xml_output_file_env(self):
-    xml_dir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
+    xml_dir = self.create_tempdir('xml_dir').full_path
     xml_output_file_env = os.path.join(xml_dir, 'xml_output_file.xml')
-    random_dir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
+    random_dir = self._decoy_xml_dir
     self.run_helper(
         6,
         [],
@@ -197,9 +335,8 @@ class TestCaseTest(BaseTestCase):
         expect_success=True)
 
   def test_xml_output_file_from_daemon(self):
-    tmpdir = os.path.join(tempfile.mkdtemp(
-        dir=absltest.TEST_TMPDIR.value), 'sub_dir')
-    random_dir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
+    tmpdir = os.path.join(self.create_tempdir('tmpdir').full_path, 'sub_dir')
+    random_dir = self._decoy_xml_dir
     self.run_helper(
         6,
         ['--test_tmpdir', tmpdir],
@@ -212,7 +349,7 @@ class TestCaseTest(BaseTestCase):
         expect_success=True)
 
   def test_xml_output_file_from_test_xmloutputdir_env(self):
-    xml_output_dir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
+    xml_output_dir = self.create_tempdir('xml_output_dir').full_path
     expected_xml_file = 'absltest_test_helper.xml'
     self.run_helper(
         6,
@@ -226,9 +363,9 @@ class TestCaseTest(BaseTestCase):
         expect_success=True)
 
   def test_xml_output_file_from_flag(self):
-    random_dir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
+    random_dir = self._decoy_xml_dir
     flag_file = os.path.join(
-        tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value), 'output.xml')
+        self.create_tempdir('flag_dir').full_path, 'output.xml')
     self.run_helper(
         6,
         ['--xml_output_file', flag_file],
@@ -260,13 +397,14 @@ class TestCaseTest(BaseTestCase):
     self.assertNotIn(0, [1, 2, 3])
     self.assertNotIn('otter', animals)
 
-    self.assertRaises(AssertionError, self.assertIn, 'x', 'abc')
-    self.assertRaises(AssertionError, self.assertIn, 4, [1, 2, 3])
-    self.assertRaises(AssertionError, self.assertIn, 'elephant', animals)
-
-    self.assertRaises(AssertionError, self.assertNotIn, 'c', 'abc')
-    self.assertRaises(AssertionError, self.assertNotIn, 1, [1, 2, 3])
-    self.assertRaises(AssertionError, self.assertNotIn, 'cow', animals)
+    self._assert_all_raise(AssertionError, [
+        (self.assertIn, ('x', 'abc')),
+        (self.assertIn, (4, [1, 2, 3])),
+        (self.assertIn, ('elephant', animals)),
+        (self.assertNotIn, ('c', 'abc')),
+        (self.assertNotIn, (1, [1, 2, 3])),
+        (self.assertNotIn, ('cow', animals)),
+    ])
 
   @absltest.expectedFailure
   def test_expected_failure(self):
@@ -300,14 +438,16 @@ class TestCaseTest(BaseTestCase):
     self.assertSequenceEqual(a, tuple(b))
     self.assertSequenceEqual(tuple(a), b)
 
-    self.assertRaises(AssertionError, self.assertListEqual, a, tuple(b))
-    self.assertRaises(AssertionError, self.assertTupleEqual, tuple(a), b)
-    self.assertRaises(AssertionError, self.assertListEqual, None, b)
-    self.assertRaises(AssertionError, self.assertTupleEqual, None, tuple(b))
-    self.assertRaises(AssertionError, self.assertSequenceEqual, None, tuple(b))
-    self.assertRaises(AssertionError, self.assertListEqual, 1, 1)
-    self.assertRaises(AssertionError, self.assertTupleEqual, 1, 1)
-    self.assertRaises(AssertionError, self.assertSequenceEqual, 1, 1)
+    self._assert_all_raise(AssertionError, [
+        (self.assertListEqual, (a, tuple(b))),
+        (self.assertTupleEqual, (tuple(a), b)),
+        (self.assertListEqual, (None, b)),
+        (self.assertTupleEqual, (None, tuple(b))),
+        (self.assertSequenceEqual, (None, tuple(b))),
+        (self.assertListEqual, (1, 1)),
+        (self.assertTupleEqual, (1, 1)),
+        (self.assertSequenceEqual, (1, 1)),
+    ])
 
     self.assertSameElements([1, 2, 3], [3, 2, 1])
     self.assertSameElements([1, 2] + [3] * 100, [1] * 100 + [2, 3])
@@ -338,36 +478,17 @@ class TestCaseTest(BaseTestCase):
   def test_assert_mapping_equal(self, class1, class2):
     self.assertMappingEqual(class1(), class2())
 
-    self.assertRaisesRegex(
-        absltest.TestCase.failureException,
-        r' [!][=] ',
-        self.assertMappingEqual,
-        class1(x=1),
-        class2(),
-        'These are unequal',
-    )
-    self.assertRaisesRegex(
-        absltest.TestCase.failureException,
-        r' [!][=] ',
-        self.assertMappingEqual,
-        class1(x=1, y=2),
-        class2(x=1, y=3),
-    )
-
-    self.assertRaisesRegex(
-        AssertionError,
-        'should be a Mapping',
-        self.assertMappingEqual,
-        class1(),
-        (),
-    )
-    self.assertRaisesRegex(
-        AssertionError,
-        'should be a Mapping',
-        self.assertMappingEqual,
-        (),
-        class2(),
-    )
+    failure_cases = [
+        (absltest.TestCase.failureException, r' [!][=] ',
+         (class1(x=1), class2(), 'These are unequal')),
+        (absltest.TestCase.failureException, r' [!][=] ',
+         (class1(x=1, y=2), class2(x=1, y=3))),
+        (AssertionError, 'should be a Mapping', (class1(), ())),
+        (AssertionError, 'should be a Mapping', ((), class2())),
+    ]
+    for exception, regex, args in failure_cases:
+      with self.subTest(args=args), self.assertRaisesRegex(exception, regex):
+        self.assertMappingEqual(*args)
 
   def test_assert_mapping_equal_mapping_type(self):
     d1 = dict(one=1, two=2)
@@ -502,18 +623,12 @@ Missing entries:
     # Ensure deterministic output of keys in dictionaries whose sort order
     # doesn't match the lexical ordering of repr -- this is most Python objects,
     # which are keyed by memory address.
-    class Obj:
-
-      def __init__(self, name):
-        self.name = name
-
-      def __repr__(self):
-        return self.name
-
     try:
       assert_dict_equal(
-          {'a': Obj('A'), Obj('b'): Obj('B'), Obj('c'): Obj('C')},
-          {'a': Obj('A'), Obj('d'): Obj('D'), Obj('e'): Obj('E')},
+          {'a': _NamedObj('A'), _NamedObj('b'): _NamedObj('B'),
+           _NamedObj('c'): _NamedObj('C')},
+          {'a': _NamedObj('A'), _NamedObj('d'): _NamedObj('D'),
+           _NamedObj('e'): _NamedObj('E')},
       )
     except AssertionError as e:
       # Do as best we can not to be misleading when objects have the same repr
@@ -534,15 +649,10 @@ Missing entries:
       self.fail('Expecting AssertionError')
 
     # Confirm that safe_repr, not repr, is being used.
-    class RaisesOnRepr:
-
-      def __repr__(self):
-        return 1/0  # Intentionally broken __repr__ implementation.
-
     try:
       assert_dict_equal(
-          {RaisesOnRepr(): RaisesOnRepr()},
-          {RaisesOnRepr(): RaisesOnRepr()},
+          {_RaisesOnRepr(): _RaisesOnRepr()},
+          {_RaisesOnRepr(): _RaisesOnRepr()},
       )
       self.fail('Expected dicts not to match')
     except AssertionError as e:
@@ -561,18 +671,10 @@ Missing entries:
 """)
 
     # Confirm that safe_repr, not repr, is being used.
-    class RaisesOnLt:
-
-      def __lt__(self, unused_other):
-        raise TypeError('Object is unordered.')
-
-      def __repr__(self):
-        return '<RaisesOnLt object>'
-
     try:
       assert_dict_equal(
-          {RaisesOnLt(): RaisesOnLt()},
-          {RaisesOnLt(): RaisesOnLt()},
+          {_RaisesOnLt(): _RaisesOnLt()},
+          {_RaisesOnLt(): _RaisesOnLt()},
       )
     except AssertionError as e:
       self.assertIn('Unexpected, but present entries:\n<RaisesOnLt', str(e))
@@ -583,10 +685,12 @@ Missing entries:
     set2 = set()
     self.assertSetEqual(set1, set2)
 
-    self.assertRaises(AssertionError, self.assertSetEqual, None, set2)
-    self.assertRaises(AssertionError, self.assertSetEqual, [], set2)
-    self.assertRaises(AssertionError, self.assertSetEqual, set1, None)
-    self.assertRaises(AssertionError, self.assertSetEqual, set1, [])
+    self._assert_all_raise(AssertionError, [
+        (self.assertSetEqual, (None, set2)),
+        (self.assertSetEqual, ([], set2)),
+        (self.assertSetEqual, (set1, None)),
+        (self.assertSetEqual, (set1, [])),
+    ])
 
     set1 = {'a'}
     set2 = set()
@@ -783,9 +887,8 @@ Missing entries:
       self.assertRegexMatch('foo str', [b'str', 'foo'])
 
   def test_assert_command_fails_stderr(self):
-    tmpdir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
     self.assertCommandFails(
-        ['cat', os.path.join(tmpdir, 'file.txt')],
+        ['cat', _missing_file_path()],
         ['No such file or directory'],
         env=_env_for_command_tests())
 
@@ -814,11 +917,9 @@ Missing entries:
 
   def test_assert_command_succeeds_stderr(self):
     expected_re = re.compile('No such file or directory')
-    tmpdir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
-
     with self.assertRaisesRegex(AssertionError, expected_re):
       self.assertCommandSucceeds(
-          ['cat', os.path.join(tmpdir, 'file.txt')],
+          ['cat', _missing_file_path()],
           env=_env_for_command_tests())
 
   def test_assert_command_succeeds_with_matching_unicode_regexes(self):
@@ -852,87 +953,22 @@ Missing entries:
     self.assertCommandSucceeds('true', env=_env_for_command_tests())
 
   def test_inequality(self):
-    # Try ints
-    self.assertGreater(2, 1)
-    self.assertGreaterEqual(2, 1)
-    self.assertGreaterEqual(1, 1)
-    self.assertLess(1, 2)
-    self.assertLessEqual(1, 2)
-    self.assertLessEqual(1, 1)
-    self.assertRaises(AssertionError, self.assertGreater, 1, 2)
-    self.assertRaises(AssertionError, self.assertGreater, 1, 1)
-    self.assertRaises(AssertionError, self.assertGreaterEqual, 1, 2)
-    self.assertRaises(AssertionError, self.assertLess, 2, 1)
-    self.assertRaises(AssertionError, self.assertLess, 1, 1)
-    self.assertRaises(AssertionError, self.assertLessEqual, 2, 1)
-
-    # Try Floats
-    self.assertGreater(1.1, 1.0)
-    self.assertGreaterEqual(1.1, 1.0)
-    self.assertGreaterEqual(1.0, 1.0)
-    self.assertLess(1.0, 1.1)
-    self.assertLessEqual(1.0, 1.1)
-    self.assertLessEqual(1.0, 1.0)
-    self.assertRaises(AssertionError, self.assertGreater, 1.0, 1.1)
-    self.assertRaises(AssertionError, self.assertGreater, 1.0, 1.0)
-    self.assertRaises(AssertionError, self.assertGreaterEqual, 1.0, 1.1)
-    self.assertRaises(AssertionError, self.assertLess, 1.1, 1.0)
-    self.assertRaises(AssertionError, self.assertLess, 1.0, 1.0)
-    self.assertRaises(AssertionError, self.assertLessEqual, 1.1, 1.0)
-
-    # Try Strings
-    self.assertGreater('bug', 'ant')
-    self.assertGreaterEqual('bug', 'ant')
-    self.assertGreaterEqual('ant', 'ant')
-    self.assertLess('ant', 'bug')
-    self.assertLessEqual('ant', 'bug')
-    self.assertLessEqual('ant', 'ant')
-    self.assertRaises(AssertionError, self.assertGreater, 'ant', 'bug')
-    self.assertRaises(AssertionError, self.assertGreater, 'ant', 'ant')
-    self.assertRaises(AssertionError, self.assertGreaterEqual, 'ant', 'bug')
-    self.assertRaises(AssertionError, self.assertLess, 'bug', 'ant')
-    self.assertRaises(AssertionError, self.assertLess, 'ant', 'ant')
-    self.assertRaises(AssertionError, self.assertLessEqual, 'bug', 'ant')
-
-    # Try Unicode
-    self.assertGreater('bug', 'ant')
-    self.assertGreaterEqual('bug', 'ant')
-    self.assertGreaterEqual('ant', 'ant')
-    self.assertLess('ant', 'bug')
-    self.assertLessEqual('ant', 'bug')
-    self.assertLessEqual('ant', 'ant')
-    self.assertRaises(AssertionError, self.assertGreater, 'ant', 'bug')
-    self.assertRaises(AssertionError, self.assertGreater, 'ant', 'ant')
-    self.assertRaises(AssertionError, self.assertGreaterEqual, 'ant', 'bug')
-    self.assertRaises(AssertionError, self.assertLess, 'bug', 'ant')
-    self.assertRaises(AssertionError, self.assertLess, 'ant', 'ant')
-    self.assertRaises(AssertionError, self.assertLessEqual, 'bug', 'ant')
-
-    # Try Mixed String/Unicode
-    self.assertGreater('bug', 'ant')
-    self.assertGreater('bug', 'ant')
-    self.assertGreaterEqual('bug', 'ant')
-    self.assertGreaterEqual('bug', 'ant')
-    self.assertGreaterEqual('ant', 'ant')
-    self.assertGreaterEqual('ant', 'ant')
-    self.assertLess('ant', 'bug')
-    self.assertLess('ant', 'bug')
-    self.assertLessEqual('ant', 'bug')
-    self.assertLessEqual('ant', 'bug')
-    self.assertLessEqual('ant', 'ant')
-    self.assertLessEqual('ant', 'ant')
-    self.assertRaises(AssertionError, self.assertGreater, 'ant', 'bug')
-    self.assertRaises(AssertionError, self.assertGreater, 'ant', 'bug')
-    self.assertRaises(AssertionError, self.assertGreater, 'ant', 'ant')
-    self.assertRaises(AssertionError, self.assertGreater, 'ant', 'ant')
-    self.assertRaises(AssertionError, self.assertGreaterEqual, 'ant', 'bug')
-    self.assertRaises(AssertionError, self.assertGreaterEqual, 'ant', 'bug')
-    self.assertRaises(AssertionError, self.assertLess, 'bug', 'ant')
-    self.assertRaises(AssertionError, self.assertLess, 'bug', 'ant')
-    self.assertRaises(AssertionError, self.assertLess, 'ant', 'ant')
-    self.assertRaises(AssertionError, self.assertLess, 'ant', 'ant')
-    self.assertRaises(AssertionError, self.assertLessEqual, 'bug', 'ant')
-    self.assertRaises(AssertionError, self.assertLessEqual, 'bug', 'ant')
+    for small, large in ((1, 2), (1.0, 1.1), ('ant', 'bug')):
+      with self.subTest(small=small, large=large):
+        self.assertGreater(large, small)
+        self.assertGreaterEqual(large, small)
+        self.assertGreaterEqual(small, small)
+        self.assertLess(small, large)
+        self.assertLessEqual(small, large)
+        self.assertLessEqual(small, small)
+        self._assert_all_raise(AssertionError, [
+            (self.assertGreater, (small, large)),
+            (self.assertGreater, (small, small)),
+            (self.assertGreaterEqual, (small, large)),
+            (self.assertLess, (large, small)),
+            (self.assertLess, (small, small)),
+            (self.assertLessEqual, (large, small)),
+        ])
 
   def test_assert_multi_line_equal(self):
     sample_text = """\
@@ -1183,6 +1219,11 @@ test case
     self.assertContainsSubsequence(['foo', 'bar', 'blorp'], [])
     self.assertContainsSubsequence([], [])
 
+  def test_assert_contains_subsequence_with_none_element(self):
+    self.assertContainsSubsequence([1, None, 2], [None, 2])
+    with self.assertRaises(AssertionError):
+      self.assertContainsSubsequence([1, 2], [None])
+
   def test_assert_contains_subsequence_with_empty_container(self):
     with self.assertRaises(AssertionError):
       self.assertContainsSubsequence([], [1])
@@ -1231,67 +1272,16 @@ test case
     self.assertTotallyOrdered([(1, 1)], [(1, 2)], [(2, 1)])
 
     # From the docstring.
-    class A:
-
-      def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-      def __hash__(self):
-        return hash(self.x)
-
-      def __repr__(self):
-        return 'A(%r, %r)' % (self.x, self.y)
-
-      def __eq__(self, other):
-        try:
-          return self.x == other.x
-        except AttributeError:
-          return NotImplemented
-
-      def __ne__(self, other):
-        try:
-          return self.x != other.x
-        except AttributeError:
-          return NotImplemented
-
-      def __lt__(self, other):
-        try:
-          return self.x < other.x
-        except AttributeError:
-          return NotImplemented
-
-      def __le__(self, other):
-        try:
-          return self.x <= other.x
-        except AttributeError:
-          return NotImplemented
-
-      def __gt__(self, other):
-        try:
-          return self.x > other.x
-        except AttributeError:
-          return NotImplemented
-
-      def __ge__(self, other):
-        try:
-          return self.x >= other.x
-        except AttributeError:
-          return NotImplemented
-
-    class B(A):
-      """Like A, but not hashable."""
-      __hash__ = None
-
     self.assertTotallyOrdered(
-        [A(1, 'a')],
-        [A(2, 'b')],  # 2 is after 1.
+        [_OrderedOnX(1, 'a')],
+        [_OrderedOnX(2, 'b')],  # 2 is after 1.
         [
-            A(3, 'c'),
-            B(3, 'd'),
-            B(3, 'e')  # The second argument is irrelevant.
+            _OrderedOnX(3, 'c'),
+            _UnhashableOrderedOnX(3, 'd'),
+            # The second argument is irrelevant.
+            _UnhashableOrderedOnX(3, 'e'),
         ],
-        [A(4, 'z')])
+        [_OrderedOnX(4, 'z')])
 
     # Invalid.
     msg = 'This is a useful message'
@@ -1330,19 +1320,22 @@ test case
         'Tests shortDescription() for a method with a longer docstring.',
     )
 
-  def test_assert_url_equal_same(self):
-    self.assertUrlEqual('http://a', 'http://a')
-    self.assertUrlEqual('http://a/path/test', 'http://a/path/test')
-    self.assertUrlEqual('#fragment', '#fragment')
-    self.assertUrlEqual('http://a/?q=1', 'http://a/?q=1')
-    self.assertUrlEqual('http://a/?q=1&v=5', 'http://a/?v=5&q=1')
-    self.assertUrlEqual('/logs?v=1&a=2&t=labels&f=path%3A%22foo%22',
-                        '/logs?a=2&f=path%3A%22foo%22&v=1&t=labels')
-    self.assertUrlEqual('http://a/path;p1', 'http://a/path;p1')
-    self.assertUrlEqual('http://a/path;p2;p3;p1', 'http://a/path;p1;p2;p3')
-    self.assertUrlEqual('sip:alice@atlanta.com;maddr=239.255.255.1;ttl=15',
-                        'sip:alice@atlanta.com;ttl=15;maddr=239.255.255.1')
-    self.assertUrlEqual('http://nyan/cat?p=1&b=', 'http://nyan/cat?b=&p=1')
+  @parameterized.parameters(
+      ('http://a', 'http://a'),
+      ('http://a/path/test', 'http://a/path/test'),
+      ('#fragment', '#fragment'),
+      ('http://a/?q=1', 'http://a/?q=1'),
+      ('http://a/?q=1&v=5', 'http://a/?v=5&q=1'),
+      ('/logs?v=1&a=2&t=labels&f=path%3A%22foo%22',
+       '/logs?a=2&f=path%3A%22foo%22&v=1&t=labels'),
+      ('http://a/path;p1', 'http://a/path;p1'),
+      ('http://a/path;p2;p3;p1', 'http://a/path;p1;p2;p3'),
+      ('sip:alice@atlanta.com;maddr=239.255.255.1;ttl=15',
+       'sip:alice@atlanta.com;ttl=15;maddr=239.255.255.1'),
+      ('http://nyan/cat?p=1&b=', 'http://nyan/cat?b=&p=1'),
+  )
+  def test_assert_url_equal_same(self, a, b):
+    self.assertUrlEqual(a, b)
 
   def test_assert_url_equal_different(self):
     msg = 'This is a useful message'
@@ -1389,33 +1382,20 @@ test case
 
   def test_same_structure_different(self):
     # Different type
-    with self.assertRaisesRegex(
-        AssertionError,
-        r"a is a <(type|class) 'int'> but b is a <(type|class) 'str'>"):
-      self.assertSameStructure(0, 'hello')
-    with self.assertRaisesRegex(
-        AssertionError,
-        r"a is a <(type|class) 'int'> but b is a <(type|class) 'list'>"):
-      self.assertSameStructure(0, [])
-    with self.assertRaisesRegex(
-        AssertionError,
-        r"a is a <(type|class) 'int'> but b is a <(type|class) 'float'>"):
-      self.assertSameStructure(2, 2.0)
-
-    with self.assertRaisesRegex(
-        AssertionError,
-        r"a is a <(type|class) 'list'> but b is a <(type|class) 'dict'>"):
-      self.assertSameStructure([], {})
-
-    with self.assertRaisesRegex(
-        AssertionError,
-        r"a is a <(type|class) 'list'> but b is a <(type|class) 'set'>"):
-      self.assertSameStructure([], set())
-
-    with self.assertRaisesRegex(
-        AssertionError,
-        r"a is a <(type|class) 'dict'> but b is a <(type|class) 'set'>"):
-      self.assertSameStructure({}, set())
+    for a, b, a_type, b_type in (
+        (0, 'hello', 'int', 'str'),
+        (0, [], 'int', 'list'),
+        (2, 2.0, 'int', 'float'),
+        ([], {}, 'list', 'dict'),
+        ([], set(), 'list', 'set'),
+        ({}, set(), 'dict', 'set'),
+    ):
+      with self.subTest(a=a, b=b):
+        with self.assertRaisesRegex(
+            AssertionError,
+            r"a is a <(type|class) '%s'> but b is a <(type|class) '%s'>"
+            % (a_type, b_type)):
+          self.assertSameStructure(a, b)
 
     # Different scalar values
     self.assertRaisesWithLiteralMatch(
@@ -1601,18 +1581,16 @@ test case
 class GetCommandStderrTestCase(absltest.TestCase):
 
   def test_return_status(self):
-    tmpdir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
     returncode = (
         absltest.get_command_stderr(
-            ['cat', os.path.join(tmpdir, 'file.txt')],
+            ['cat', _missing_file_path()],
             env=_env_for_command_tests())[0])
     self.assertEqual(1, returncode)
 
   def test_stderr(self):
-    tmpdir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
     stderr = (
         absltest.get_command_stderr(
-            ['cat', os.path.join(tmpdir, 'file.txt')],
+            ['cat', _missing_file_path()],
             env=_env_for_command_tests())[1])
     stderr = stderr.decode('utf-8')
     self.assertRegex(stderr, 'No such file or directory')
@@ -1902,7 +1880,8 @@ class TestAssertEmpty(absltest.TestCase):
         bytearray(),
     ]
     for container in empty_containers:
-      self.assertEmpty(container)
+      with self.subTest(container=container):
+        self.assertEmpty(container)
 
   def test_raises_with_not_empty_containers(self):
     not_empty_containers = [
@@ -1917,8 +1896,9 @@ class TestAssertEmpty(absltest.TestCase):
     ]
     regexp = r'.* has length of 1\.$'
     for container in not_empty_containers:
-      with self.assertRaisesRegex(AssertionError, regexp):
-        self.assertEmpty(container)
+      with self.subTest(container=container):
+        with self.assertRaisesRegex(AssertionError, regexp):
+          self.assertEmpty(container)
 
   def test_user_message_added_to_default(self):
     msg = 'This is a useful message'
@@ -1960,7 +1940,8 @@ class TestAssertNotEmpty(absltest.TestCase):
         bytearray(b'a'),
     ]
     for container in not_empty_containers:
-      self.assertNotEmpty(container)
+      with self.subTest(container=container):
+        self.assertNotEmpty(container)
 
   def test_raises_with_empty_containers(self):
     empty_containers = [
@@ -1975,8 +1956,9 @@ class TestAssertNotEmpty(absltest.TestCase):
     ]
     regexp = r'.* has length of 0\.$'
     for container in empty_containers:
-      with self.assertRaisesRegex(AssertionError, regexp):
-        self.assertNotEmpty(container)
+      with self.subTest(container=container):
+        with self.assertRaisesRegex(AssertionError, regexp):
+          self.assertNotEmpty(container)
 
   def test_user_message_added_to_default(self):
     msg = 'This is a useful message'
@@ -2005,7 +1987,8 @@ class TestAssertLen(absltest.TestCase):
         [bytearray(b'ghij'), 4],
     ]
     for container, expected_len in containers:
-      self.assertLen(container, expected_len)
+      with self.subTest(container=container):
+        self.assertLen(container, expected_len)
 
   def test_raises_when_unexpected_len(self):
     containers = [
@@ -2020,8 +2003,9 @@ class TestAssertLen(absltest.TestCase):
     ]
     for container in containers:
       regexp = r'.* has length of %d, expected 100\.$' % len(container)
-      with self.assertRaisesRegex(AssertionError, regexp):
-        self.assertLen(container, 100)
+      with self.subTest(container=container):
+        with self.assertRaisesRegex(AssertionError, regexp):
+          self.assertLen(container, 100)
 
   def test_user_message_added_to_default(self):
     msg = 'This is a useful message'
@@ -2229,6 +2213,26 @@ class GetCommandStringTest(parameterized.TestCase):
 
 class TempFileTest(BaseTestCase):
 
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    # The helper runs of the three cleanup modes are independent, so start
+    # them all before the first test waits on one. They start before any test
+    # method runs, so each mode gets a TEST_TMPDIR owned by the class.
+    cls._tempfile_helper_runs = {}
+    for cleanup in ('SUCCESS', 'ALWAYS', 'OFF'):
+      tmpdir = tempfile.mkdtemp(dir=absltest.TEST_TMPDIR.value)
+      cls.addClassCleanup(shutil.rmtree, tmpdir, ignore_errors=True)
+      future = cls.submit_helper(
+          0,
+          ['TempFileHelperTest'],
+          {
+              'ABSLTEST_TEST_HELPER_TEMPFILE_CLEANUP': cleanup,
+              'TEST_TMPDIR': tmpdir,
+          },
+      )
+      cls._tempfile_helper_runs[cleanup] = (tmpdir, future)
+
   def assert_dir_exists(self, temp_dir):
     path = temp_dir.full_path
     self.assertTrue(os.path.exists(path), f'Dir {path} does not exist')
@@ -2249,13 +2253,9 @@ class TempFileTest(BaseTestCase):
     self.assertEqual(expected_content, actual)
 
   def run_tempfile_helper(self, cleanup, expected_paths):
-    tmpdir = self.create_tempdir('helper-test-temp-dir')
-    env = {
-        'ABSLTEST_TEST_HELPER_TEMPFILE_CLEANUP': cleanup,
-        'TEST_TMPDIR': tmpdir.full_path,
-        }
-    stdout, stderr, _ = self.run_helper(
-        0, ['TempFileHelperTest'], env, expect_success=False
+    tmpdir, future = self._tempfile_helper_runs[cleanup]
+    stdout, stderr, _ = self.assert_helper_result(
+        future.result(), expect_success=False
     )
     output = ('\n=== Helper output ===\n'
               '----- stdout -----\n{}\n'
@@ -2269,9 +2269,7 @@ class TempFileTest(BaseTestCase):
     expected_paths = {path.replace('/', os.sep) for path in expected_paths}
 
     actual = {
-        os.path.relpath(f, tmpdir.full_path)
-        for f in _listdir_recursive(tmpdir.full_path)
-        if f != tmpdir.full_path
+        os.path.relpath(f, tmpdir) for f in _listdir_recursive(tmpdir)
     }
     self.assertEqual(expected_paths, actual, output)
 
@@ -2656,10 +2654,19 @@ class ExitCodeTest(BaseTestCase):
 
 
 def _listdir_recursive(path):
-  for dirname, _, filenames in os.walk(path):
-    yield dirname
-    for filename in filenames:
-      yield os.path.join(dirname, filename)
+  """Yields the paths of all files and directories below `path`."""
+  stack = [path]
+  while stack:
+    with os.scandir(stack.pop()) as entries:
+      for entry in entries:
+        yield entry.path
+        if entry.is_dir(follow_symlinks=False):
+          stack.append(entry.path)
+
+
+def _missing_file_path():
+  """Returns a path under TEST_TMPDIR that is never created."""
+  return os.path.join(absltest.TEST_TMPDIR.value, 'nonexistent', 'file.txt')
 
 
 def _env_for_command_tests():
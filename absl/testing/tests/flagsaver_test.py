@@ -171,6 +171,20 @@ class SaveFlagValuesTest(absltest.TestCase):
     self.assertEqual('unchanged0', FLAGS['flagsaver_test_flag0'].value)
     self.assertEqual(0, FLAGS['flagsaver_test_flag0'].present)
 
+  def test_short_name(self):
+    flag_values = flags.FlagValues()
+    flags.DEFINE_string(
+        'long_name', 'unchanged', 'help', short_name='s',
+        flag_values=flag_values)
+    saved_flag_values = flagsaver.save_flag_values(flag_values)
+    # Both names refer to the same flag, so they share one saved copy.
+    self.assertIs(saved_flag_values['long_name'], saved_flag_values['s'])
+
+    flag_values['long_name'].value = 'new value'
+    flagsaver.restore_flag_values(saved_flag_values, flag_values)
+    self.assertEqual('unchanged', flag_values['long_name'].value)
+    self.assertIs(flag_values['long_name'], flag_values['s'])
+
   def test_assign_validators(self):
     # First save the flag.
     saved_flag_values = flagsaver.save_flag_values()